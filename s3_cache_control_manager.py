@@ -12,14 +12,33 @@ Features:
 """
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError
+try:
+    import orjson  # Optional: much faster backup save/load for large buckets
+except ImportError:
+    orjson = None
 import sys
 import os
 import json
 import argparse
+import csv
+import io
+import mimetypes
+import operator
+import queue
+import string
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Tuple, Optional
+from itertools import compress, repeat
+from urllib.parse import quote, urlencode
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from functools import partial
+from typing import Any, Callable, Iterable, List, Dict, Iterator, Optional, Sequence, Tuple
 import re
 
 # ==============================================================================
@@ -28,16 +47,27 @@ import re
 
 # Default cache-control settings
 DEFAULT_CACHE_CONTROL = 'public, max-age=31536000, immutable'
-DEFAULT_MAX_WORKERS = 10
+DEFAULT_MAX_WORKERS = 64
+
+# S3 client tuning: the HTTP connection pool must be at least as large as the
+# number of worker threads, or workers queue up waiting for a connection
+MIN_POOL_CONNECTIONS = 50
+S3_RETRY_CONFIG = {'mode': 'adaptive', 'max_attempts': 5}
 
 # File extensions to update (images and SVGs by default)
-DEFAULT_ALLOWED_EXTENSIONS = {
+DEFAULT_ALLOWED_EXTENSIONS = frozenset({
     '.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.ico',
     '.svg'
-}
+})
 
 # Skip specific extensions (HTML, CSS, JS)
-DEFAULT_SKIP_EXTENSIONS = {'.html', '.htm', '.css', '.js', '.json', '.xml', '.txt','.tiff', '.tif', '.avif', '.heic', '.heif'}
+DEFAULT_SKIP_EXTENSIONS = frozenset({'.html', '.htm', '.css', '.js', '.json', '.xml', '.txt','.tiff', '.tif', '.avif', '.heic', '.heif'})
+
+# Progress output is buffered and written in batches of this many lines
+# (or at least every PROGRESS_FLUSH_SECONDS), instead of one print per object
+PROGRESS_FLUSH_LINES = 100
+PROGRESS_FLUSH_SECONDS = 1.0
+KEY_DISPLAY_WIDTH = 60  # longer keys are shown as '...' + their tail
 
 # Backup file location
 BACKUP_DIR = '.s3_cache_backups'
@@ -50,31 +80,165 @@ METADATA_UPDATED_BY_KEY = 'updated-by'  # Will become: x-amz-meta-updated-by
 METADATA_UPDATED_BY_VALUE = 'S3CacheControlManager'
 METADATA_UPDATE_TIME_KEY = 'update-time'  # Will become: x-amz-meta-update-time
 
+# copy_object handles objects up to 5 GiB; larger objects are copied in
+# place with a multipart upload (UploadPartCopy), limited to 10,000 parts
+MAX_SINGLE_COPY_SIZE = 5 * 1024 ** 3
+MULTIPART_COPY_PART_SIZE = 512 * 1024 ** 2
+MAX_MULTIPART_PARTS = 10000
+
+# Parallel listing: pages buffered per listing worker before workers wait
+# for the filter to catch up, and how often a waiting worker checks for stop
+LIST_QUEUE_PAGES_PER_WORKER = 4
+LIST_QUEUE_PUT_TIMEOUT = 0.1
+
+# S3 Batch Operations settings (--batch-ops)
+BATCH_MANIFEST_PREFIX = 's3-cache-control-manager/batch-ops'
+BATCH_JOB_PRIORITY = 10
+BATCH_POLL_INTERVAL = 15  # seconds between describe_job calls
+BATCH_TERMINAL_STATUSES = {'Complete', 'Failed', 'Cancelled'}
+
+# Content-Type used for compressed keys (e.g. 'x.svg.gz') when setting metadata
+# from scratch (--force, --batch-ops); other encodings fall back to binary/octet-stream
+COMPRESSED_CONTENT_TYPES = {
+    'gzip': 'application/gzip',
+    'bzip2': 'application/x-bzip2',
+    'xz': 'application/x-xz',
+}
+
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
+class ProgressOutput:
+    """
+    Buffer per-object progress lines and write them to stdout in batches.
+    
+    Use as a context manager so buffered lines are flushed even if the
+    run is interrupted.
+    """
+    
+    def __init__(self, flush_lines: int = PROGRESS_FLUSH_LINES, flush_seconds: float = PROGRESS_FLUSH_SECONDS):
+        self.flush_lines = flush_lines
+        self.flush_seconds = flush_seconds
+        self.lines = []
+        self.last_flush = time.monotonic()
+    
+    def add(self, line: str) -> None:
+        """Queue a line, flushing if the batch is full or stale."""
+        self.lines.append(line)
+        if len(self.lines) >= self.flush_lines or time.monotonic() - self.last_flush >= self.flush_seconds:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write all buffered lines to stdout."""
+        if self.lines:
+            sys.stdout.write('\n'.join(self.lines) + '\n')
+            sys.stdout.flush()
+            self.lines.clear()
+        self.last_flush = time.monotonic()
+    
+    def __enter__(self) -> 'ProgressOutput':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+
+def shorten_key(key: str, width: int = KEY_DISPLAY_WIDTH) -> str:
+    """Shorten a key for progress output, keeping its (most specific) end."""
+    return key if len(key) <= width else '...' + key[3 - width:]
+
+
 def get_backup_filename(bucket: str, operation: str) -> str:
     """Generate a timestamped backup filename."""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    return os.path.join(BACKUP_DIR, f'{bucket}_{operation}_{timestamp}.json')
+    return os.path.join(BACKUP_DIR, f'{bucket}_{operation}_{timestamp}.jsonl')
 
 
-def save_backup(backup_data: List[Dict], filename: str) -> None:
-    """Save backup data to a JSON file."""
-    try:
-        with open(filename, 'w') as f:
-            json.dump(backup_data, f, indent=2)
-        print(f"✓ Backup saved to: {filename}")
-    except Exception as e:
-        print(f"⚠️  Warning: Could not save backup file: {e}")
+def encode_backup_record(record: Dict) -> bytes:
+    """Encode one backup record as a JSON line (using orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return (json.dumps(record) + '\n').encode('utf-8')
+
+
+class BackupWriter:
+    """
+    Append backup records to a JSON Lines file from worker threads.
+    
+    Workers write each record before changing the object, and every record
+    is flushed to the operating system immediately, so a run that is
+    interrupted or crashes never leaves a modified object without its
+    backup (a power loss can still drop the most recent records).
+    
+    An existing file is never overwritten: if two runs start in the same
+    second, the second one gets a numbered filename (see self.filename).
+    """
+    
+    def __init__(self, filename: str):
+        base, extension = os.path.splitext(filename)
+        attempt = 0
+        while True:
+            self.filename = f'{base}_{attempt}{extension}' if attempt else filename
+            try:
+                self.fp = open(self.filename, 'xb')
+                break
+            except FileExistsError:
+                attempt += 1
+        self.lock = threading.Lock()
+        self.count = 0
+    
+    def write(self, record: Dict) -> None:
+        """Write and flush one record."""
+        line = encode_backup_record(record)
+        with self.lock:
+            self.fp.write(line)
+            self.fp.flush()
+            self.count += 1
+    
+    def close(self) -> None:
+        self.fp.close()
+
+
+def _loads(data: bytes):
+    """Decode JSON bytes (using orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def load_backup(filename: str) -> List[Dict]:
-    """Load backup data from a JSON file."""
+    """
+    Load backup data from a backup file.
+    
+    Backups are JSON Lines (one record per line, written as objects are
+    updated). Older backups stored as a single JSON array are also accepted.
+    A truncated last line, e.g. from an interrupted run, is ignored.
+    
+    The file is read a line at a time, so only the records themselves are
+    held in memory.
+    """
     try:
-        with open(filename, 'r') as f:
-            return json.load(f)
+        with open(filename, 'rb') as f:
+            lines = (line for line in f if line.strip())
+            previous = next(lines, None)
+            if previous is None:
+                return []
+            
+            if previous.lstrip().startswith(b'['):
+                return _loads(previous + f.read())
+            
+            # Decode each line once the next one is read, so the last line is
+            # known when it is decoded
+            records = []
+            for line in lines:
+                records.append(_loads(previous))
+                previous = line
+            try:
+                records.append(_loads(previous))
+            except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
+                print(f"⚠️  Warning: Ignoring incomplete last line in backup file: {filename}")
+        return records
     except FileNotFoundError:
         print(f"❌ Error: Backup file not found: {filename}")
         sys.exit(1)
@@ -86,116 +250,191 @@ def load_backup(filename: str) -> List[Dict]:
         sys.exit(1)
 
 
-def matches_pattern(key: str, patterns: List[str], match_type: str = 'prefix') -> bool:
+def build_union_regex(patterns: Optional[List[str]]) -> Optional[re.Pattern]:
     """
-    Check if a key matches any of the given patterns.
+    Combine literal substrings into a single precompiled alternation.
     
     Args:
-        key: S3 object key
-        patterns: List of patterns to match against
-        match_type: 'prefix', 'suffix', 'contains', or 'regex'
+        patterns: Literal substrings (regex metacharacters are escaped)
     
     Returns:
-        True if key matches any pattern
+        Compiled pattern, or None if no patterns were given (match all)
     """
     if not patterns:
-        return True  # No filter means match all
-    
-    for pattern in patterns:
-        if match_type == 'prefix':
-            if key.startswith(pattern):
-                return True
-        elif match_type == 'suffix':
-            if key.endswith(pattern):
-                return True
-        elif match_type == 'contains':
-            if pattern in key:
-                return True
-        elif match_type == 'regex':
-            try:
-                if re.search(pattern, key):
-                    return True
-            except re.error:
-                print(f"⚠️  Warning: Invalid regex pattern: {pattern}")
+        return None
     
-    return False
+    return re.compile('|'.join(re.escape(pattern) for pattern in patterns))
 
 
-def should_process_file(
-    key: str,
-    folder_filters: List[str],
-    file_filters: List[str],
-    allowed_extensions: set,
-    skip_extensions: set,
-    use_extension_filter: bool = True
-) -> Tuple[bool, str]:
+def build_extension_regex(extensions: Sequence[str]) -> re.Pattern:
     """
-    Check if file should be processed based on filters and extensions.
-    
-    Args:
-        key: S3 object key (file path)
-        folder_filters: List of folder prefixes to include
-        file_filters: List of filename patterns to include
-        allowed_extensions: Set of allowed file extensions
-        skip_extensions: Set of extensions to skip
-        use_extension_filter: Whether to apply extension filtering
+    Compile a case-insensitive regex matching keys that end in any of the extensions.
     
-    Returns:
-        Tuple of (should_process: bool, reason: str)
+    This folds extension extraction, lowercasing and the set lookup into a
+    single regex search per key.
     """
+    alternation = '|'.join(sorted(re.escape(ext.lstrip('.')) for ext in extensions))
+    return re.compile(rf'\.(?:{alternation})\Z', re.IGNORECASE | re.ASCII)
+
+
+def key_skip_reason(key: str) -> Optional[str]:
+    """Reason a key is skipped whatever the filters (empty key, directory marker), or None."""
     # Handle empty keys
-    if not key or key.strip() == '':
-        return False, "Empty key"
+    if not key or key.isspace():
+        return "Empty key"
     
     # Skip S3 "folders" (keys ending with /)
     if key.endswith('/'):
-        return False, "Directory marker"
+        return "Directory marker"
+    
+    return None
+
+
+def extension_skip_reason(key: str, allowed_extensions: frozenset, skip_extensions: frozenset) -> Optional[str]:
+    """
+    Check a key against the extension filter.
+    
+    Returns:
+        Reason the key is skipped, or None if its extension is allowed
+    """
+    reason = key_skip_reason(key)
+    if reason is not None:
+        return reason
+    
+    # Get file extension
+    dot_idx = key.rfind('.')
+    if dot_idx < 0 or '/' in key[dot_idx:]:
+        return "No extension"
+    
+    # Only the (short) suffix needs lowercasing
+    extension = key[dot_idx:].lower()
+    
+    # Check skip list first
+    if extension in skip_extensions:
+        return f"Skipped extension: {extension}"
     
-    # Apply folder filters
-    if folder_filters:
-        if not matches_pattern(key, folder_filters, 'prefix'):
-            return False, "Does not match folder filter"
+    # Check allowed list
+    if extension not in allowed_extensions:
+        return f"Extension not in allowed list: {extension}"
     
-    # Apply file filters
-    if file_filters:
-        filename = key.split('/')[-1]
-        if not matches_pattern(filename, file_filters, 'contains'):
-            return False, "Does not match file filter"
+    return None
+
+
+def build_file_filter(
+    file_patterns: Optional[List[str]],
+    use_extension_filter: bool = True,
+    allowed_extensions: frozenset = DEFAULT_ALLOWED_EXTENSIONS,
+    skip_extensions: frozenset = DEFAULT_SKIP_EXTENSIONS
+) -> Callable[[str], Optional[str]]:
+    """
+    Build a key filter specialized for the active filters.
+    
+    Only the checks that are actually enabled end up in the returned
+    function, and all patterns are precompiled, so the per-key work in
+    large listings is as small as possible.
+    
+    Folder filters are not part of it: they are applied server-side by
+    listing only the folder prefixes.
+    
+    Args:
+        file_patterns: Filename substrings to include
+        use_extension_filter: Whether to apply extension filtering
+        allowed_extensions: Set of allowed file extensions
+        skip_extensions: Set of extensions to skip
+    
+    Returns:
+        Function taking a key and returning the reason it is skipped, or
+        None if it should be processed
+    """
+    checks = []
+    
+    file_regex = build_union_regex(file_patterns)
+    if file_regex is not None:
+        file_search = file_regex.search
+        
+        def check_file(key: str) -> Optional[str]:
+            # Search the filename part in place instead of slicing it out
+            return None if file_search(key, key.rfind('/') + 1) else "Does not match file filter"
+        
+        checks.append(check_file)
     
-    # Apply extension filters if enabled
     if use_extension_filter:
-        # Get file extension
-        if '.' not in key.lower():
-            return False, "No extension"
+        allowed_search = build_extension_regex(allowed_extensions - skip_extensions).search
+        
+        def check_extension(key: str) -> Optional[str]:
+            # Fast path: one regex search accepts allowed extensions; the
+            # extension is only extracted to explain why a key is skipped
+            if allowed_search(key):
+                return None
+            return extension_skip_reason(key, allowed_extensions, skip_extensions)
         
-        extension = '.' + key.lower().split('.')[-1]
+        if not checks:
+            # Empty keys and directory markers never match the extension
+            # regex and are reported by extension_skip_reason
+            return check_extension
+        checks.append(check_extension)
+    
+    if not checks:
+        return key_skip_reason
+    
+    if len(checks) == 1:
+        check = checks[0]
         
-        # Check skip list first
-        if extension in skip_extensions:
-            return False, f"Skipped extension: {extension}"
+        def key_filter(key: str) -> Optional[str]:
+            return key_skip_reason(key) or check(key)
         
-        # Check allowed list
-        if extension not in allowed_extensions:
-            return False, f"Extension not in allowed list: {extension}"
+        return key_filter
+    
+    def key_filter(key: str) -> Optional[str]:
+        reason = key_skip_reason(key)
+        if reason is not None:
+            return reason
+        for check in checks:
+            reason = check(key)
+            if reason is not None:
+                return reason
+        return None
+    
+    return key_filter
+
+
+def create_s3_client(region: Optional[str], max_workers: int):
+    """
+    Create an S3 client tuned for many parallel requests.
     
-    return True, "Matches filters"
+    The connection pool is sized to the worker count, sockets are kept
+    alive between requests, and adaptive retries back off on throttling.
+    """
+    config = Config(
+        max_pool_connections=max(MIN_POOL_CONNECTIONS, max_workers * 2),
+        retries=S3_RETRY_CONFIG,
+        tcp_keepalive=True
+    )
+    if region:
+        return boto3.client('s3', region_name=region, config=config)
+    return boto3.client('s3', config=config)
 
 
 def verify_aws_credentials(s3_client, bucket: str) -> bool:
     """
     Verify AWS credentials and bucket access.
     
+    Uses a one-key list_objects_v2 call rather than head_bucket: it checks
+    the same ListBucket permission the run needs and, unlike a HEAD, returns
+    error codes with a body. It also opens the first pooled connection (TLS
+    handshake) before the parallel work starts.
+    
     Returns:
         True if credentials are valid and bucket is accessible
     """
     try:
-        s3_client.head_bucket(Bucket=bucket)
+        s3_client.list_objects_v2(Bucket=bucket, MaxKeys=1)
         return True
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-        if error_code == '404':
+        if error_code in ('NoSuchBucket', '404'):
             print(f"❌ Error: Bucket '{bucket}' does not exist")
-        elif error_code == '403':
+        elif error_code in ('AccessDenied', '403'):
             print(f"❌ Error: Access denied to bucket '{bucket}'")
             print("   Check your AWS credentials and IAM permissions")
         else:
@@ -206,38 +445,34 @@ def verify_aws_credentials(s3_client, bucket: str) -> bool:
         return False
 
 
-def list_all_objects(s3_client, bucket: str, prefix: str = '') -> List[str]:
+def paginate_objects(
+    s3_client,
+    bucket: str,
+    prefix: str = '',
+    start_after: str = ''
+) -> Iterator[Dict]:
     """
-    List all objects in an S3 bucket with optional prefix.
+    Yield raw ListObjectsV2 pages, exiting with a clear message on errors.
     
     Args:
         s3_client: Boto3 S3 client
         bucket: S3 bucket name
         prefix: Optional prefix to filter objects
+        start_after: Optional key to start listing after
     
-    Returns:
-        List of object keys
+    Yields:
+        ListObjectsV2 response pages
     """
-    objects = []
     paginator = s3_client.get_paginator('list_objects_v2')
     
     try:
-        page_count = 0
         pagination_config = {'Bucket': bucket}
         if prefix:
             pagination_config['Prefix'] = prefix
+        if start_after:
+            pagination_config['StartAfter'] = start_after
         
-        for page in paginator.paginate(**pagination_config):
-            page_count += 1
-            if 'Contents' in page:
-                for obj in page['Contents']:
-                    objects.append(obj['Key'])
-            
-            # Progress indicator for large buckets
-            if page_count % 10 == 0:
-                print(f"  ... fetched {len(objects)} objects so far")
-        
-        return objects
+        yield from paginator.paginate(**pagination_config)
     
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
@@ -255,14 +490,360 @@ def list_all_objects(s3_client, bucket: str, prefix: str = '') -> List[str]:
         sys.exit(1)
 
 
+def collapse_prefixes(prefixes: Optional[List[str]]) -> List[str]:
+    """
+    Reduce folder prefixes to a minimal, non-overlapping set.
+    
+    A prefix that is covered by a shorter one (e.g. 'assets/images/' by
+    'assets/') is dropped, so listing each remaining prefix never returns
+    the same key twice.
+    
+    Returns:
+        Sorted list of prefixes ([''] lists the whole bucket)
+    """
+    if not prefixes:
+        return ['']
+    
+    collapsed = []
+    for prefix in sorted(set(prefixes)):
+        if not collapsed or not prefix.startswith(collapsed[-1]):
+            collapsed.append(prefix)
+    return collapsed
+
+
+# (key, size, storage class) of an object, as returned by ListObjectsV2
+ListedObject = Tuple[str, Optional[int], Optional[str]]
+
+
+def page_objects(page: Dict) -> List[ListedObject]:
+    """Extract (key, size, storage class) tuples from a ListObjectsV2 page."""
+    return [(obj['Key'], obj.get('Size'), obj.get('StorageClass')) for obj in page.get('Contents', ())]
+
+
+def _put_until_stopped(out_queue: queue.Queue, item: Any, stop_event: threading.Event) -> bool:
+    """Put item on a bounded queue, giving up once the consumer has stopped."""
+    while not stop_event.is_set():
+        try:
+            out_queue.put(item, timeout=LIST_QUEUE_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+# Characters tried as split points for each kind of character seen on a page
+_SPLIT_CHAR_CLASSES = {
+    char: chars
+    for chars in (string.digits, string.ascii_lowercase, string.ascii_uppercase)
+    for char in chars
+}
+
+# (prefix, after, until): keys under prefix with after < key <= until
+# ('' starts at the beginning of the prefix, None runs to its end)
+KeyRange = Tuple[str, str, Optional[str]]
+
+
+def split_key_range(prefix: str, keys: List[str], until: Optional[str], max_ranges: int) -> List[KeyRange]:
+    """
+    Split the unlisted rest of a range, after a full page of keys, into at most max_ranges ranges.
+    
+    Nothing is known about the keys past the page, so the split points are
+    guessed from it, at two positions: where the page's keys start to
+    differ (or the nearest position before it with room left), and the
+    start of the folder containing that position. At each position the
+    next characters of the kinds seen there (digits, lowercase or
+    uppercase letters, or the exact other characters) are tried, up to the
+    highest of each kind on the page. An empty guess costs a single LIST
+    request; ranges that turn out large are split again later.
+    
+    Args:
+        prefix: Prefix being listed
+        keys: Keys of the last (sorted, full) page
+        until: Inclusive end of the range, or None for the end of the prefix
+        max_ranges: Maximum number of ranges to return
+    
+    Returns:
+        Contiguous ranges covering (keys[-1], until], or [] if no split point fits
+    """
+    last = keys[-1]
+    diverge = len(os.path.commonprefix([keys[0], last]))
+    if max_ranges < 2 or diverge >= len(last):
+        return []
+    folder_start = max(last.rfind('/', len(prefix), diverge) + 1, len(prefix))
+    
+    # Letters are only tried up to the highest one on the page (e.g. 'f' for hex keys)
+    seen = set(''.join(key[len(prefix):] for key in keys))
+    
+    def points_at(depth: int) -> List[str]:
+        alphabet = set()
+        for char in {key[depth] for key in keys if len(key) > depth}:
+            chars = _SPLIT_CHAR_CLASSES.get(char, char)
+            alphabet.update(chars[:chars.index(max(seen.intersection(chars))) + 1])
+        return [
+            last[:depth] + char for char in alphabet
+            if char > last[depth] and (until is None or last[:depth] + char < until)
+        ]
+    
+    # The deepest position with room left (e.g. not already at '9'), plus the folder start
+    points = set(points_at(folder_start))
+    for depth in range(diverge, folder_start, -1):
+        depth_points = points_at(depth)
+        if depth_points:
+            points.update(depth_points)
+            break
+    points = sorted(points)
+    if not points:
+        return []
+    
+    if len(points) >= max_ranges:
+        # Keep evenly spaced split points
+        step = len(points) / (max_ranges - 1)
+        points = [points[int(i * step)] for i in range(max_ranges - 1)]
+    
+    bounds = [last] + points + [until]
+    return [(prefix, bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+
+def list_object_pages_parallel(
+    s3_client,
+    bucket: str,
+    prefixes: List[str],
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Iterator[List[ListedObject]]:
+    """
+    Stream pages of objects for several prefixes, listing them concurrently.
+    
+    Each prefix starts as one key range. Whenever a range returns a full
+    page while workers are idle, the rest of it is split into smaller
+    ranges (see split_key_range) that are listed in parallel with
+    StartAfter, so a single large prefix, or the whole bucket, is spread
+    over the workers whatever its folder layout. No key is listed twice,
+    and at most LIST_QUEUE_PAGES_PER_WORKER pages per worker are buffered.
+    Pages are yielded in arbitrary order.
+    
+    Args:
+        s3_client: Boto3 S3 client
+        bucket: S3 bucket name
+        prefixes: Non-overlapping prefixes (see collapse_prefixes)
+        max_workers: Maximum number of concurrent list requests
+    
+    Yields:
+        Lists of (key, size, storage class) tuples, one per ListObjectsV2 page
+    """
+    page_count = 0
+    object_count = 0
+    
+    def counted(objects: List[ListedObject]) -> List[ListedObject]:
+        nonlocal page_count, object_count
+        page_count += 1
+        object_count += len(objects)
+        # Progress indicator for large buckets
+        if page_count % 10 == 0:
+            print(f"  ... fetched {object_count} objects so far")
+        return objects
+    
+    out_queue = queue.Queue(maxsize=max_workers * LIST_QUEUE_PAGES_PER_WORKER)
+    stop_event = threading.Event()
+    lock = threading.Lock()
+    active = 0  # ranges submitted and not finished yet
+    
+    def submit(key_range: KeyRange) -> None:
+        nonlocal active
+        with lock:
+            active += 1
+        executor.submit(list_range, key_range)
+    
+    def list_range(key_range: KeyRange) -> None:
+        """Worker: push one list of objects per page onto the queue; the last range to finish pushes None."""
+        nonlocal active
+        prefix, after, until = key_range
+        try:
+            for page in paginate_objects(s3_client, bucket, prefix, start_after=after):
+                objects = page_objects(page)
+                # Keys are listed in order, so the range ends once a page passes until
+                reached_end = until is not None and objects and objects[-1][0] >= until
+                if reached_end:
+                    objects = [obj for obj in objects if obj[0] <= until]
+                if not _put_until_stopped(out_queue, objects, stop_event):
+                    return
+                if reached_end:
+                    break
+                
+                # Split whatever is left of a full page's range while workers are idle
+                idle = max_workers - active
+                subranges = []
+                if page.get('IsTruncated') and idle > 0:
+                    subranges = split_key_range(prefix, [obj[0] for obj in objects], until, idle + 1)
+                if subranges:
+                    for subrange in subranges:
+                        submit(subrange)
+                    break
+        except BaseException as e:  # includes SystemExit raised on listing errors
+            _put_until_stopped(out_queue, e, stop_event)
+        finally:
+            with lock:
+                active -= 1
+                finished = active == 0
+            if finished:
+                _put_until_stopped(out_queue, None, stop_event)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for prefix in prefixes:
+            submit((prefix, '', None))
+        
+        try:
+            while True:
+                item = out_queue.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                
+                yield counted(item)
+        finally:
+            stop_event.set()
+
+
+def guess_content_type(key: str) -> str:
+    """
+    Guess an object's Content-Type from its key's extension.
+    
+    The key is treated as a file path, never as a URL, so keys such as
+    'data:x.png' or 'a#b.png' resolve by their extension. Compressed keys
+    (e.g. 'x.svg.gz') get the compressed file's type, because their body is
+    still compressed once Content-Encoding is dropped.
+    """
+    # guess_file_type (Python 3.13+) never parses a URL; before that, a leading
+    # '/' keeps guess_type from reading the start of the key as a URL scheme
+    guess_file_type = getattr(mimetypes, 'guess_file_type', None)
+    filename = '/' + key.rsplit('/', 1)[-1]
+    if guess_file_type:
+        content_type, encoding = guess_file_type(filename)
+    else:
+        content_type, encoding = mimetypes.guess_type(filename)
+    
+    if encoding is not None:
+        return COMPRESSED_CONTENT_TYPES.get(encoding, 'binary/octet-stream')
+    return content_type or 'binary/octet-stream'
+
+
+def run_bounded(fn: Callable[[Any], Dict], items: Iterable, max_workers: int) -> Iterator[Dict]:
+    """
+    Run fn over items on a thread pool, yielding results as they complete.
+    
+    At most 2 * max_workers tasks are pending at any time (like a semaphore
+    around the S3 calls), so very large inputs don't create one future per
+    item up front and results start flowing immediately.
+    
+    Args:
+        fn: Callable taking one item and returning a result dictionary
+        items: Items to process (may be a generator)
+        max_workers: Number of worker threads
+    
+    Yields:
+        Result dictionaries, in completion order
+    """
+    max_pending = max_workers * 2
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        try:
+            for item in items:
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(executor.submit(fn, item))
+            
+            for future in as_completed(pending):
+                yield future.result()
+        finally:
+            # On early exit (e.g. Ctrl+C) drop tasks that haven't started;
+            # running ones finish before the executor shuts down
+            for future in pending:
+                future.cancel()
+
+
+def multipart_copy_object(s3_client, copy_args: Dict, size: int, etag: Optional[str] = None) -> None:
+    """
+    Copy an object onto itself with new metadata using UploadPartCopy.
+    
+    Needed for objects larger than 5 GiB, which copy_object rejects. Object
+    tags are carried over (copy_object keeps them by default), and the
+    multipart upload is aborted if any part fails.
+    
+    Args:
+        s3_client: Boto3 S3 client
+        copy_args: copy_object arguments (Bucket, Key, CopySource, metadata...)
+        size: Object size in bytes
+        etag: ETag the source must still have for every part, so an object
+            overwritten mid-copy fails instead of producing a mixed result
+    """
+    bucket = copy_args['Bucket']
+    key = copy_args['Key']
+    create_args = {k: v for k, v in copy_args.items() if k not in ('CopySource', 'MetadataDirective')}
+    part_size = max(MULTIPART_COPY_PART_SIZE, -(-size // MAX_MULTIPART_PARTS))
+    
+    tag_set = s3_client.get_object_tagging(Bucket=bucket, Key=key).get('TagSet', [])
+    if tag_set:
+        create_args['Tagging'] = urlencode([(tag['Key'], tag['Value']) for tag in tag_set])
+    
+    part_args = {'Bucket': bucket, 'Key': key, 'CopySource': copy_args['CopySource']}
+    if etag:
+        part_args['CopySourceIfMatch'] = etag
+    
+    upload_id = s3_client.create_multipart_upload(**create_args)['UploadId']
+    try:
+        parts = []
+        for part_number, start in enumerate(range(0, size, part_size), 1):
+            end = min(start + part_size, size) - 1
+            response = s3_client.upload_part_copy(
+                CopySourceRange=f'bytes={start}-{end}',
+                PartNumber=part_number,
+                UploadId=upload_id,
+                **part_args
+            )
+            parts.append({'ETag': response['CopyPartResult']['ETag'], 'PartNumber': part_number})
+        
+        s3_client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': parts}
+        )
+    except BaseException:
+        # Don't let a failed abort hide the error that caused it
+        try:
+            s3_client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not abort multipart upload {upload_id} for {key}: {e}")
+        raise
+
+
+def copy_object_in_place(
+    s3_client,
+    copy_args: Dict,
+    size: Optional[int] = None,
+    etag: Optional[str] = None
+) -> None:
+    """Run copy_args with copy_object, or a multipart copy for objects over 5 GiB."""
+    if size is not None and size > MAX_SINGLE_COPY_SIZE:
+        multipart_copy_object(s3_client, copy_args, size, etag)
+    else:
+        s3_client.copy_object(**copy_args)
+
+
 def update_object_metadata(
     s3_client,
     bucket: str,
     key: str,
     cache_control: str,
     dry_run: bool = False,
-    save_backup: bool = True,
-    add_metadata: bool = True
+    backup_writer: Optional[BackupWriter] = None,
+    add_metadata: bool = True,
+    force: bool = False,
+    size: Optional[int] = None,
+    storage_class: Optional[str] = None
 ) -> Dict:
     """
     Update cache-control metadata for a single S3 object and add custom metadata.
@@ -273,28 +854,45 @@ def update_object_metadata(
         key: S3 object key
         cache_control: Cache-Control header value
         dry_run: If True, don't actually make changes
-        save_backup: If True, include original metadata in return
+        backup_writer: If given, the original metadata is written to it
+            before the object is changed
         add_metadata: If True, add custom metadata to identify the update
+        force: If True, skip the head_object pre-check and copy unconditionally.
+            Content-Type is guessed from the extension, and user metadata,
+            Content-Encoding, Content-Language and Content-Disposition are
+            not preserved (incompatible with backup_writer)
+        size: Object size from the listing (used when force is set)
+        storage_class: Storage class from the listing (used when force is set)
     
     Returns:
-        Dictionary with status, key, backup data, and optional error/info
+        Dictionary with status, key, and optional error/info
     """
     try:
-        # Get current object metadata
-        try:
-            response = s3_client.head_object(Bucket=bucket, Key=key)
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            if error_code == '404':
-                return {'status': 'error', 'key': key, 'error': 'Object not found (404)'}
-            elif error_code == '403':
-                return {'status': 'error', 'key': key, 'error': 'Access denied (403)'}
-            else:
-                return {'status': 'error', 'key': key, 'error': f'Head object failed: {error_code}'}
+        if force:
+            if dry_run:
+                return {'status': 'dry_run', 'key': key, 'info': 'Would update (forced, current value not checked)'}
+            # Size and storage class come from the listing; the rest is unknown
+            response = {
+                'ContentType': guess_content_type(key),
+                'ContentLength': size,
+                'StorageClass': storage_class,
+            }
+        else:
+            # Get current object metadata
+            try:
+                response = s3_client.head_object(Bucket=bucket, Key=key)
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                if error_code == '404':
+                    return {'status': 'error', 'key': key, 'error': 'Object not found (404)'}
+                elif error_code == '403':
+                    return {'status': 'error', 'key': key, 'error': 'Access denied (403)'}
+                else:
+                    return {'status': 'error', 'key': key, 'error': f'Head object failed: {error_code}'}
         
         # Store backup data
         backup_data = None
-        if save_backup:
+        if backup_writer is not None:
             backup_data = {
                 'key': key,
                 'cache_control': response.get('CacheControl', ''),
@@ -303,24 +901,24 @@ def update_object_metadata(
                 'content_encoding': response.get('ContentEncoding'),
                 'content_language': response.get('ContentLanguage'),
                 'content_disposition': response.get('ContentDisposition'),
+                'storage_class': response.get('StorageClass'),
+                'content_length': response.get('ContentLength'),
             }
         
         # Check if Cache-Control is already set correctly
         current_cache_control = response.get('CacheControl', '')
-        if current_cache_control == cache_control:
+        if not force and current_cache_control == cache_control:
             return {
                 'status': 'skipped',
                 'key': key,
-                'info': 'Already has correct Cache-Control',
-                'backup': backup_data
+                'info': 'Already has correct Cache-Control'
             }
         
         if dry_run:
             return {
                 'status': 'dry_run',
                 'key': key,
-                'info': f'Would update (Current: {current_cache_control or "none"})',
-                'backup': backup_data
+                'info': f'Would update (Current: {current_cache_control or "none"})'
             }
         
         # Prepare metadata for copy
@@ -345,20 +943,26 @@ def update_object_metadata(
             'Metadata': metadata
         }
         
-        # Add optional attributes if they exist
+        # Add optional attributes if they exist (StorageClass is only returned
+        # for non-STANDARD objects; without it the copy would reset to STANDARD)
         for attr, arg_name in [
             ('ContentEncoding', 'ContentEncoding'),
             ('ContentLanguage', 'ContentLanguage'),
-            ('ContentDisposition', 'ContentDisposition')
+            ('ContentDisposition', 'ContentDisposition'),
+            ('StorageClass', 'StorageClass')
         ]:
             value = response.get(attr)
             if value:
                 copy_args[arg_name] = value
         
+        # Save the original metadata before touching the object
+        if backup_data is not None:
+            backup_writer.write(backup_data)
+        
         # Perform the copy
-        s3_client.copy_object(**copy_args)
+        copy_object_in_place(s3_client, copy_args, response.get('ContentLength'), response.get('ETag'))
         
-        return {'status': 'success', 'key': key, 'backup': backup_data}
+        return {'status': 'success', 'key': key}
     
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
@@ -388,17 +992,17 @@ def revert_object_metadata(s3_client, bucket: str, backup_item: Dict, dry_run: b
     key = backup_item['key']
     
     try:
-        # Verify object still exists
-        try:
-            s3_client.head_object(Bucket=bucket, Key=key)
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            if error_code == '404':
-                return {'status': 'error', 'key': key, 'error': 'Object not found (may have been deleted)'}
-            else:
-                return {'status': 'error', 'key': key, 'error': f'Cannot access object: {error_code}'}
-        
         if dry_run:
+            # Verify object still exists (a real revert lets copy_object report this)
+            try:
+                s3_client.head_object(Bucket=bucket, Key=key)
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                if error_code == '404':
+                    return {'status': 'error', 'key': key, 'error': 'Object not found (may have been deleted)'}
+                else:
+                    return {'status': 'error', 'key': key, 'error': f'Cannot access object: {error_code}'}
+            
             return {
                 'status': 'dry_run',
                 'key': key,
@@ -424,19 +1028,24 @@ def revert_object_metadata(s3_client, bucket: str, backup_item: Dict, dry_run: b
         for key_name, arg_name in [
             ('content_encoding', 'ContentEncoding'),
             ('content_language', 'ContentLanguage'),
-            ('content_disposition', 'ContentDisposition')
+            ('content_disposition', 'ContentDisposition'),
+            ('storage_class', 'StorageClass')
         ]:
             value = backup_item.get(key_name)
             if value:
                 copy_args[arg_name] = value
         
-        # Perform the copy
-        s3_client.copy_object(**copy_args)
+        # Perform the copy (backups from older versions have no size)
+        copy_object_in_place(s3_client, copy_args, backup_item.get('content_length'))
         
         return {'status': 'success', 'key': key}
     
     except ClientError as e:
         error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+        if error_code in ('NoSuchKey', '404'):
+            return {'status': 'error', 'key': key, 'error': 'Object not found (may have been deleted)'}
+        if error_code == 'NoSuchBucket':
+            return {'status': 'error', 'key': key, 'error': f"Bucket '{bucket}' does not exist"}
         error_msg = e.response.get('Error', {}).get('Message', str(e))
         return {'status': 'error', 'key': key, 'error': f'{error_code}: {error_msg}'}
     
@@ -444,6 +1053,128 @@ def revert_object_metadata(s3_client, bucket: str, backup_item: Dict, dry_run: b
         return {'status': 'error', 'key': key, 'error': f'Unexpected error: {str(e)}'}
 
 
+def upload_batch_manifest(s3_client, bucket: str, keys: List[str], manifest_bucket: str, manifest_key: str) -> str:
+    """
+    Upload an S3 Batch Operations CSV manifest (Bucket,Key rows).
+    
+    Args:
+        s3_client: Boto3 S3 client
+        bucket: Bucket containing the objects to process
+        keys: Object keys to include in the manifest
+        manifest_bucket: Bucket to upload the manifest to
+        manifest_key: Key for the manifest object
+    
+    Returns:
+        ETag of the uploaded manifest (required by create_job)
+    """
+    # Spool the CSV to a temporary file instead of building it in memory
+    with tempfile.TemporaryFile() as fp:
+        text = io.TextIOWrapper(fp, encoding='utf-8', newline='')
+        writer = csv.writer(text, lineterminator='\n')
+        for key in keys:
+            # Batch Operations expects URL-encoded keys in CSV manifests
+            writer.writerow([bucket, quote(key, safe='/')])
+        text.flush()
+        text.detach()
+        fp.seek(0)
+        
+        response = s3_client.put_object(
+            Bucket=manifest_bucket,
+            Key=manifest_key,
+            Body=fp,
+            ContentType='text/csv'
+        )
+    return response['ETag'].strip('"')
+
+
+def create_batch_copy_job(
+    s3control_client,
+    account_id: str,
+    bucket: str,
+    role_arn: str,
+    manifest_bucket: str,
+    manifest_key: str,
+    manifest_etag: str,
+    report_prefix: str,
+    cache_control: str,
+    content_type: str,
+    storage_class: str,
+    user_metadata: Dict[str, str]
+) -> str:
+    """
+    Create an S3 Batch Operations job that copies objects in place with new metadata.
+    
+    storage_class is set on the copies, which would otherwise become STANDARD.
+    
+    Returns:
+        Job ID
+    """
+    new_metadata = {'CacheControl': cache_control, 'ContentType': content_type}
+    if user_metadata:
+        new_metadata['UserMetadata'] = user_metadata
+    
+    response = s3control_client.create_job(
+        AccountId=account_id,
+        ConfirmationRequired=False,
+        Operation={
+            'S3PutObjectCopy': {
+                'TargetResource': f'arn:aws:s3:::{bucket}',
+                'MetadataDirective': 'REPLACE',
+                'NewObjectMetadata': new_metadata,
+                'StorageClass': storage_class,
+            }
+        },
+        Report={
+            'Bucket': f'arn:aws:s3:::{manifest_bucket}',
+            'Format': 'Report_CSV_20180820',
+            'Enabled': True,
+            'Prefix': report_prefix,
+            'ReportScope': 'FailedTasksOnly',
+        },
+        Manifest={
+            'Spec': {'Format': 'S3BatchOperations_CSV_20180820', 'Fields': ['Bucket', 'Key']},
+            'Location': {
+                'ObjectArn': f'arn:aws:s3:::{manifest_bucket}/{manifest_key}',
+                'ETag': manifest_etag,
+            },
+        },
+        ClientRequestToken=str(uuid.uuid4()),
+        Priority=BATCH_JOB_PRIORITY,
+        RoleArn=role_arn,
+        Description=f'Set Cache-Control on {bucket} ({content_type}, {storage_class})'
+    )
+    return response['JobId']
+
+
+def wait_for_batch_jobs(s3control_client, account_id: str, job_ids: List[str]) -> Dict[str, Dict]:
+    """
+    Poll Batch Operations jobs until they all reach a terminal status.
+    
+    Returns:
+        Dictionary mapping job ID to its final describe_job 'Job' data
+    """
+    finished = {}
+    while len(finished) < len(job_ids):
+        for job_id in job_ids:
+            if job_id in finished:
+                continue
+            job = s3control_client.describe_job(AccountId=account_id, JobId=job_id)['Job']
+            progress = job.get('ProgressSummary', {})
+            print(
+                f"  Job {job_id}: {job['Status']} "
+                f"({progress.get('NumberOfTasksSucceeded', 0)} succeeded, "
+                f"{progress.get('NumberOfTasksFailed', 0)} failed, "
+                f"{progress.get('TotalNumberOfTasks', '?')} total)"
+            )
+            if job['Status'] in BATCH_TERMINAL_STATUSES:
+                finished[job_id] = job
+        
+        if len(finished) < len(job_ids):
+            time.sleep(BATCH_POLL_INTERVAL)
+    
+    return finished
+
+
 # ==============================================================================
 # MAIN OPERATIONS
 # ==============================================================================
@@ -455,12 +1186,19 @@ def operation_update(args):
     print("S3 Cache-Control Update Operation")
     print("="*70)
     
+    if args.batch_ops and not args.batch_role_arn:
+        print("\n❌ Error: --batch-ops requires --batch-role-arn")
+        sys.exit(1)
+    if args.batch_ops and not args.manifest_bucket:
+        print("\n❌ Error: --batch-ops requires --manifest-bucket (manifests and reports are written there)")
+        sys.exit(1)
+    if args.force and not args.no_backup and not args.dry_run:
+        print("\n❌ Error: --force skips the metadata lookup needed for backups; add --no-backup")
+        sys.exit(1)
+    
     # Initialize S3 client
     try:
-        if args.region:
-            s3_client = boto3.client('s3', region_name=args.region)
-        else:
-            s3_client = boto3.client('s3')
+        s3_client = create_s3_client(args.region, args.max_workers)
     except Exception as e:
         print(f"\n❌ Error initializing AWS client: {e}")
         print("   Make sure AWS credentials are configured (aws configure)")
@@ -484,18 +1222,43 @@ def operation_update(args):
         print(f"Extension Filter: ENABLED (images/SVGs only)")
     else:
         print(f"Extension Filter: DISABLED (all files)")
+    if args.force:
+        print("Force Mode: ENABLED (no HEAD pre-check, every matched object is rewritten)")
+        print("  ⚠️  Content-Type is set from the file extension; existing user metadata,")
+        print("     Content-Encoding, Content-Language and Content-Disposition are not preserved")
+    if args.batch_ops:
+        print(f"Batch Operations: ENABLED (role: {args.batch_role_arn})")
+        print("  ⚠️  Content-Type is set from the file extension; existing user metadata,")
+        print("     Content-Encoding, Content-Language and Content-Disposition are not preserved")
+        print("     and no backup is saved; objects over 5 GB are skipped")
     
     # Verify credentials and bucket access
-    print("\nVerifying AWS credentials and bucket access...")
-    if not verify_aws_credentials(s3_client, args.bucket):
-        sys.exit(1)
-    print("✓ Credentials verified")
+    if not args.skip_verify:
+        print("\nVerifying AWS credentials and bucket access...")
+        if not verify_aws_credentials(s3_client, args.bucket):
+            sys.exit(1)
+        print("✓ Credentials verified")
     
     # List all objects
-    print("\nListing all objects in bucket...")
-    prefix = args.folders[0] if args.folders and len(args.folders) == 1 else ''
-    object_keys = list_all_objects(s3_client, args.bucket, prefix)
-    total_objects = len(object_keys)
+    print("\nListing and filtering objects in bucket...")
+    # Folder filters are applied server-side by listing each prefix
+    prefixes = collapse_prefixes(args.folders)
+    
+    # Filter objects while they are being listed
+    filtered_objects = []
+    skip_reasons = Counter()
+    total_objects = 0
+    
+    key_filter = build_file_filter(args.files, not args.no_extension_filter)
+    
+    # Filter a page at a time with map/compress/Counter so the per-key loop
+    # runs in C rather than as Python bytecode
+    get_key = operator.itemgetter(0)
+    for objects in list_object_pages_parallel(s3_client, args.bucket, prefixes, args.max_workers):
+        total_objects += len(objects)
+        reasons = list(map(key_filter, map(get_key, objects)))
+        filtered_objects.extend(compress(objects, map(operator.is_, reasons, repeat(None))))
+        skip_reasons.update(filter(None, reasons))
     
     if total_objects == 0:
         print("No objects found in bucket.")
@@ -503,31 +1266,16 @@ def operation_update(args):
     
     print(f"✓ Found {total_objects} objects")
     
-    # Filter objects based on criteria
-    print("\nFiltering objects...")
-    filtered_keys = []
-    skip_reasons = {}
-    
-    allowed_ext = DEFAULT_ALLOWED_EXTENSIONS if not args.no_extension_filter else set()
-    skip_ext = DEFAULT_SKIP_EXTENSIONS if not args.no_extension_filter else set()
-    
-    for key in object_keys:
-        should_process, reason = should_process_file(
-            key,
-            args.folders,
-            args.files,
-            allowed_ext,
-            skip_ext,
-            not args.no_extension_filter
-        )
-        if should_process:
-            filtered_keys.append(key)
-        else:
-            skip_reasons[reason] = skip_reasons.get(reason, 0) + 1
+    if args.batch_ops:
+        # Batch Operations copies with CopyObject, which is limited to 5 GiB
+        batch_objects = [obj for obj in filtered_objects if obj[1] is None or obj[1] <= MAX_SINGLE_COPY_SIZE]
+        if len(batch_objects) < len(filtered_objects):
+            skip_reasons["Larger than 5 GB (update these without --batch-ops)"] += len(filtered_objects) - len(batch_objects)
+            filtered_objects = batch_objects
     
-    skipped_count = total_objects - len(filtered_keys)
+    skipped_count = total_objects - len(filtered_objects)
     
-    print(f"\n✓ Objects to update: {len(filtered_keys)}")
+    print(f"\n✓ Objects to update: {len(filtered_objects)}")
     print(f"✓ Objects skipped: {skipped_count}")
     
     if skip_reasons:
@@ -535,82 +1283,93 @@ def operation_update(args):
         for reason, count in sorted(skip_reasons.items(), key=lambda x: x[1], reverse=True):
             print(f"  - {reason}: {count}")
     
-    if len(filtered_keys) == 0:
+    if len(filtered_objects) == 0:
         print("\n⚠️  No matching objects found to update.")
         return
     
     # Confirmation prompt
     if not args.dry_run and not args.yes:
-        print(f"\n⚠️  About to update Cache-Control for {len(filtered_keys)} objects.")
+        print(f"\n⚠️  About to update Cache-Control for {len(filtered_objects)} objects.")
         response = input("Continue? (yes/no): ")
         if response.lower() not in ['yes', 'y']:
             print("Operation cancelled.")
             return
     
+    if args.batch_ops:
+        operation_batch_update(args, s3_client, filtered_objects)
+        return
+    
     print("\nProcessing objects...\n")
     
     # Update objects in parallel
     success_count = 0
     error_count = 0
     skipped_count_existing = 0
-    backup_data = []
-    
-    with ThreadPoolExecutor(max_workers=args.max_workers) as executor:
-        # Submit all tasks
-        future_to_key = {
-            executor.submit(
-                update_object_metadata,
-                s3_client,
-                args.bucket,
-                key,
-                args.cache_control,
-                args.dry_run,
-                not args.no_backup,
-                not args.no_metadata
-            ): key
-            for key in filtered_keys
-        }
-        
-        # Process completed tasks
-        for i, future in enumerate(as_completed(future_to_key), 1):
-            result = future.result()
-            
-            # Store backup data
-            if result.get('backup') and not args.no_backup:
-                backup_data.append(result['backup'])
-            
-            # Display progress
-            key_display = result['key']
-            if len(key_display) > 60:
-                key_display = '...' + key_display[-57:]
-            
-            if result['status'] == 'success':
-                success_count += 1
-                print(f"[{i}/{len(filtered_keys)}] ✓ {key_display}")
-            elif result['status'] == 'skipped':
-                skipped_count_existing += 1
-                print(f"[{i}/{len(filtered_keys)}] ⊘ {key_display} ({result.get('info', 'skipped')})")
-            elif result['status'] == 'dry_run':
-                success_count += 1
-                print(f"[{i}/{len(filtered_keys)}] 🔍 {key_display} ({result.get('info', 'would update')})")
-            else:
-                error_count += 1
-                print(f"[{i}/{len(filtered_keys)}] ✗ {key_display}")
-                print(f"    Error: {result.get('error', 'Unknown error')}")
     
-    # Save backup if not dry run and backup is enabled
-    if not args.dry_run and backup_data and not args.no_backup:
+    # Workers stream each backup record to disk before copying the object,
+    # so memory stays flat and an interrupted run still leaves a usable backup
+    backup_file = None
+    backup_writer = None
+    if not args.dry_run and not args.no_backup:
         backup_file = get_backup_filename(args.bucket, 'update')
-        save_backup(backup_data, backup_file)
-        print(f"\n💾 To revert these changes, run:")
-        print(f"   python {sys.argv[0]} revert --bucket {args.bucket} --backup {backup_file}")
+        try:
+            backup_writer = BackupWriter(backup_file)
+        except OSError as e:
+            print(f"❌ Error: Could not create backup file {backup_file}: {e}")
+            print("   Use --no-backup to proceed without a backup")
+            sys.exit(1)
+    
+    update_object = partial(
+        update_object_metadata,
+        s3_client,
+        args.bucket,
+        cache_control=args.cache_control,
+        dry_run=args.dry_run,
+        backup_writer=backup_writer,
+        add_metadata=not args.no_metadata,
+        force=args.force
+    )
+    
+    def update_fn(obj: ListedObject) -> Dict:
+        key, size, storage_class = obj
+        return update_object(key, size=size, storage_class=storage_class)
+    
+    total = len(filtered_objects)
+    try:
+        with ProgressOutput() as output:
+            for i, result in enumerate(run_bounded(update_fn, filtered_objects, args.max_workers), 1):
+                # Display progress
+                key_display = shorten_key(result['key'])
+                
+                if result['status'] == 'success':
+                    success_count += 1
+                    output.add(f"[{i}/{total}] ✓ {key_display}")
+                elif result['status'] == 'skipped':
+                    skipped_count_existing += 1
+                    output.add(f"[{i}/{total}] ⊘ {key_display} ({result.get('info', 'skipped')})")
+                elif result['status'] == 'dry_run':
+                    success_count += 1
+                    output.add(f"[{i}/{total}] 🔍 {key_display} ({result.get('info', 'would update')})")
+                else:
+                    error_count += 1
+                    output.add(f"[{i}/{total}] ✗ {key_display}")
+                    output.add(f"    Error: {result.get('error', 'Unknown error')}")
+    finally:
+        if backup_writer is not None:
+            backup_writer.close()
+            if backup_writer.count:
+                print(f"\n✓ Backup saved to: {backup_writer.filename}")
+                print(f"\n💾 To revert these changes, run:")
+                print(f"   python {sys.argv[0]} revert --bucket {args.bucket} --backup {backup_writer.filename}")
+            else:
+                os.remove(backup_writer.filename)
     
     # Summary
     print(f"\n{'='*70}")
     print(f"{'DRY RUN ' if args.dry_run else ''}Update Complete!")
     print(f"{'='*70}")
-    print(f"Total objects in bucket: {total_objects}")
-    print(f"Objects processed: {len(filtered_keys)}")
+    print(f"Objects listed: {total_objects}")
+    print(f"Objects processed: {len(filtered_objects)}")
     print(f"Successful updates: {success_count}")
     print(f"Already correct: {skipped_count_existing}")
     print(f"Errors: {error_count}")
@@ -629,6 +1388,94 @@ def operation_update(args):
         sys.exit(1)
 
 
+def operation_batch_update(args, s3_client, filtered_objects: List[ListedObject]) -> None:
+    """
+    Update cache-control with server-side S3 Batch Operations copy jobs.
+    
+    Objects are grouped by Content-Type (guessed from the extension) and
+    storage class (from the listing), since a job applies the same
+    replacement metadata and storage class to every object in its manifest.
+    """
+    groups = {}
+    for key, _, storage_class in filtered_objects:
+        groups.setdefault((guess_content_type(key), storage_class or 'STANDARD'), []).append(key)
+    
+    print("\nBatch Operations jobs:")
+    for (content_type, storage_class), keys in sorted(groups.items()):
+        print(f"  - {content_type}, {storage_class}: {len(keys)} objects")
+    
+    if args.dry_run:
+        print("\n💡 This was a dry run. Remove --dry-run flag to create the jobs.")
+        return
+    
+    user_metadata = {}
+    if not args.no_metadata:
+        user_metadata = {
+            METADATA_UPDATED_BY_KEY: METADATA_UPDATED_BY_VALUE,
+            METADATA_UPDATE_TIME_KEY: datetime.utcnow().isoformat() + 'Z',
+        }
+    
+    manifest_bucket = args.manifest_bucket
+    run_prefix = f"{BATCH_MANIFEST_PREFIX}/{args.bucket}/{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    
+    try:
+        account_id = boto3.client('sts', region_name=args.region).get_caller_identity()['Account']
+        s3control_client = boto3.client('s3control', region_name=args.region)
+        
+        job_ids = []
+        for index, ((content_type, storage_class), keys) in enumerate(sorted(groups.items())):
+            manifest_key = f'{run_prefix}/manifest_{index}.csv'
+            etag = upload_batch_manifest(s3_client, args.bucket, keys, manifest_bucket, manifest_key)
+            job_id = create_batch_copy_job(
+                s3control_client,
+                account_id,
+                args.bucket,
+                args.batch_role_arn,
+                manifest_bucket,
+                manifest_key,
+                etag,
+                f'{run_prefix}/reports',
+                args.cache_control,
+                content_type,
+                storage_class,
+                user_metadata
+            )
+            print(f"✓ Created job {job_id} for {len(keys)} {content_type} {storage_class} objects")
+            job_ids.append(job_id)
+        
+        print("\nWaiting for jobs to complete...")
+        jobs = wait_for_batch_jobs(s3control_client, account_id, job_ids)
+    
+    except ClientError as e:
+        error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+        error_msg = e.response.get('Error', {}).get('Message', str(e))
+        print(f"\n❌ Batch Operations error: {error_code}: {error_msg}")
+        sys.exit(1)
+    
+    except BotoCoreError as e:
+        print(f"\n❌ Batch Operations error: {e}")
+        sys.exit(1)
+    
+    succeeded = sum(job.get('ProgressSummary', {}).get('NumberOfTasksSucceeded', 0) for job in jobs.values())
+    failed = sum(job.get('ProgressSummary', {}).get('NumberOfTasksFailed', 0) for job in jobs.values())
+    incomplete = [job_id for job_id, job in jobs.items() if job['Status'] != 'Complete']
+    
+    # Summary
+    print(f"\n{'='*70}")
+    print("Batch Update Complete!")
+    print(f"{'='*70}")
+    print(f"Jobs: {len(jobs)}")
+    print(f"Objects submitted: {len(filtered_objects)}")
+    print(f"Successful updates: {succeeded}")
+    print(f"Errors: {failed}")
+    print(f"Reports: s3://{manifest_bucket}/{run_prefix}/reports/")
+    print(f"{'='*70}")
+    
+    if failed > 0 or incomplete:
+        print(f"\n⚠️  {failed} tasks failed and {len(incomplete)} jobs did not complete. Check the job reports.")
+        sys.exit(1)
+
+
 def operation_revert(args):
     """Revert cache-control changes using backup file."""
     
@@ -643,10 +1490,7 @@ def operation_revert(args):
     
     # Initialize S3 client
     try:
-        if args.region:
-            s3_client = boto3.client('s3', region_name=args.region)
-        else:
-            s3_client = boto3.client('s3')
+        s3_client = create_s3_client(args.region, args.max_workers)
     except Exception as e:
         print(f"\n❌ Error initializing AWS client: {e}")
         sys.exit(1)
@@ -656,10 +1500,11 @@ def operation_revert(args):
     print(f"Max Workers: {args.max_workers}")
     
     # Verify credentials
-    print("\nVerifying AWS credentials and bucket access...")
-    if not verify_aws_credentials(s3_client, args.bucket):
-        sys.exit(1)
-    print("✓ Credentials verified")
+    if not args.skip_verify:
+        print("\nVerifying AWS credentials and bucket access...")
+        if not verify_aws_credentials(s3_client, args.bucket):
+            sys.exit(1)
+        print("✓ Credentials verified")
     
     # Confirmation prompt
     if not args.dry_run and not args.yes:
@@ -675,31 +1520,23 @@ def operation_revert(args):
     success_count = 0
     error_count = 0
     
-    with ThreadPoolExecutor(max_workers=args.max_workers) as executor:
-        # Submit all tasks
-        future_to_key = {
-            executor.submit(revert_object_metadata, s3_client, args.bucket, item, args.dry_run): item['key']
-            for item in backup_data
-        }
-        
-        # Process completed tasks
-        for i, future in enumerate(as_completed(future_to_key), 1):
-            result = future.result()
-            
-            key_display = result['key']
-            if len(key_display) > 60:
-                key_display = '...' + key_display[-57:]
+    revert_fn = partial(revert_object_metadata, s3_client, args.bucket, dry_run=args.dry_run)
+    
+    total = len(backup_data)
+    with ProgressOutput() as output:
+        for i, result in enumerate(run_bounded(revert_fn, backup_data, args.max_workers), 1):
+            key_display = shorten_key(result['key'])
             
             if result['status'] == 'success':
                 success_count += 1
-                print(f"[{i}/{len(backup_data)}] ✓ {key_display}")
+                output.add(f"[{i}/{total}] ✓ {key_display}")
             elif result['status'] == 'dry_run':
                 success_count += 1
-                print(f"[{i}/{len(backup_data)}] 🔍 {key_display} ({result.get('info', 'would revert')})")
+                output.add(f"[{i}/{total}] 🔍 {key_display} ({result.get('info', 'would revert')})")
             else:
                 error_count += 1
-                print(f"[{i}/{len(backup_data)}] ✗ {key_display}")
-                print(f"    Error: {result.get('error', 'Unknown error')}")
+                output.add(f"[{i}/{total}] ✗ {key_display}")
+                output.add(f"    Error: {result.get('error', 'Unknown error')}")
     
     # Summary
     print(f"\n{'='*70}")
@@ -751,7 +1588,7 @@ Examples:
   python s3_cache_control_manager.py update --bucket my-bucket --dry-run
   
   # Revert changes from backup
-  python s3_cache_control_manager.py revert --bucket my-bucket --backup .s3_cache_backups/backup.json
+  python s3_cache_control_manager.py revert --bucket my-bucket --backup .s3_cache_backups/backup.jsonl
         """
     )
     
@@ -809,6 +1646,31 @@ Examples:
         action='store_true',
         help='Skip creating backup file'
     )
+    update_parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Skip the per-object HEAD pre-check and rewrite every matched object '
+             '(Content-Type from extension; user metadata, Content-Encoding, Content-Language and '
+             'Content-Disposition are not preserved; requires --no-backup)'
+    )
+    update_parser.add_argument(
+        '--batch-ops',
+        action='store_true',
+        help='Use S3 Batch Operations (server-side copy jobs) instead of per-object requests'
+    )
+    update_parser.add_argument(
+        '--batch-role-arn',
+        help='IAM role ARN assumed by S3 Batch Operations (required with --batch-ops)'
+    )
+    update_parser.add_argument(
+        '--manifest-bucket',
+        help='Bucket for Batch Operations manifests and reports (required with --batch-ops)'
+    )
+    update_parser.add_argument(
+        '--skip-verify',
+        action='store_true',
+        help='Skip the upfront credential/bucket check (errors surface on the first request)'
+    )
     update_parser.add_argument(
         '-y', '--yes',
         action='store_true',
@@ -834,6 +1696,11 @@ Examples:
         action='store_true',
         help='Preview changes without making them'
     )
+    revert_parser.add_argument(
+        '--skip-verify',
+        action='store_true',
+        help='Skip the upfront credential/bucket check (errors surface on the first request)'
+    )
     revert_parser.add_argument(
         '-y', '--yes',
         action='store_true',